@@ -1,11 +1,39 @@
 from __future__ import annotations
 
-import json
-import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from .template_paths import find_template_files_by_stem
+from .app_constants import NAME_MAX_LENGTH, NAME_MAX_WORDS, NAME_STOPWORDS
+from .json_codec import dumps_indented
+from .template_paths import template_stems
+
+# Maps every byte except [a-z0-9] to a space so tokens fall out of str.split().
+_NAME_WORD_TABLE = bytes(
+    byte if 48 <= byte <= 57 or 97 <= byte <= 122 else 32 for byte in range(256)
+)
+
+_PROMPT_HEADER = (
+    "You are generating a codexflow template specification.\n"
+    "Return ONLY a valid JSON object with exactly these keys:\n"
+    "{\n"
+    '  "description": "string",\n'
+    '  "role_prompt": "string",\n'
+    '  "instructions": "string",\n'
+    '  "scope": "general|specific",\n'
+    '  "specific_to": "string|null",\n'
+    '  "profile": "string|null",\n'
+    '  "repeat_for": "duration|null",\n'
+    '  "repeat_every": "duration|null"\n'
+    "}\n"
+    "Rules:\n"
+    "- No markdown, no code fences, no explanation.\n"
+    "- Keep role_prompt and instructions practical and concise.\n"
+    "- Use placeholders like {{task}}, {{root}}, {{specific_to}} only where useful.\n"
+    "- repeat_for/repeat_every should use duration strings like 2h, 30m, 1h30m.\n"
+    "- If scope is general, set specific_to to null.\n"
+    "- If scope is specific, set specific_to to a concrete target.\n\n"
+)
 
 
 def build_ai_template_prompt(
@@ -30,53 +58,44 @@ def build_ai_template_prompt(
         "repeat_for_override": repeat_for_override,
         "repeat_every_override": repeat_every_override,
     }
-    context_json = json.dumps(context, indent=2)
-    return (
-        "You are generating a codexflow template specification.\n"
-        "Return ONLY a valid JSON object with exactly these keys:\n"
-        "{\n"
-        '  "description": "string",\n'
-        '  "role_prompt": "string",\n'
-        '  "instructions": "string",\n'
-        '  "scope": "general|specific",\n'
-        '  "specific_to": "string|null",\n'
-        '  "profile": "string|null",\n'
-        '  "repeat_for": "duration|null",\n'
-        '  "repeat_every": "duration|null"\n'
-        "}\n"
-        "Rules:\n"
-        "- No markdown, no code fences, no explanation.\n"
-        "- Keep role_prompt and instructions practical and concise.\n"
-        "- Use placeholders like {{task}}, {{root}}, {{specific_to}} only where useful.\n"
-        "- repeat_for/repeat_every should use duration strings like 2h, 30m, 1h30m.\n"
-        "- If scope is general, set specific_to to null.\n"
-        "- If scope is specific, set specific_to to a concrete target.\n\n"
-        f"Context:\n{context_json}\n"
-    )
+    return f"{_PROMPT_HEADER}Context:\n{dumps_indented(context)}\n"
 
 
+@lru_cache(maxsize=512)
 def derive_template_name_from_request(request: str) -> str:
-    words = re.findall(r"[a-z0-9]+", request.lower())
-    stopwords = {
-        "a", "an", "and", "for", "from", "i", "is", "it", "of", "or",
-        "please", "role", "template", "that", "the", "this", "to", "want", "with",
-    }
-    filtered = [word for word in words if word not in stopwords]
-    chosen = filtered or words
+    chosen: list[str] = []
+    fallback: list[str] = []
+    text = request.lower().encode("ascii", "replace").translate(_NAME_WORD_TABLE)
+    for word in text.decode("ascii").split():
+        if len(fallback) < NAME_MAX_WORDS:
+            fallback.append(word)
+        if word in NAME_STOPWORDS:
+            continue
+        chosen.append(word)
+        if len(chosen) == NAME_MAX_WORDS:
+            break
+    chosen = chosen or fallback
     if not chosen:
         return "generated-role"
-    base = "-".join(chosen[:5])[:48].strip("-")
-    if not base:
-        base = "generated-role"
+    parts: list[str] = []
+    length = -1
+    for word in chosen:
+        room = NAME_MAX_LENGTH - length - 1
+        if room <= 0:
+            break
+        parts.append(word if len(word) <= room else word[:room])
+        length += len(word) + 1
+    base = "-".join(parts)
     if base[0].isdigit():
         base = f"role-{base}"
     return base
 
 
 def next_available_template_name(root: Path, base_name: str) -> str:
+    existing = template_stems(root)
     candidate = base_name
     suffix = 2
-    while find_template_files_by_stem(root, candidate):
+    while candidate in existing:
         candidate = f"{base_name}-{suffix}"
         suffix += 1
     return candidate
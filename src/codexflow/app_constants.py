@@ -2,34 +2,49 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
 CONFIG_DIR_NAME = ".codexflow"
 TEMPLATES_DIR_NAME = "templates"
 CONFIG_FILE_NAME = "config.json"
 
-TEMPLATE_EXT_TO_FORMAT = {
+TEMPLATE_EXT_TO_FORMAT = MappingProxyType({
     ".json": "json",
     ".yaml": "yaml",
     ".yml": "yaml",
-}
-FORMAT_TO_TEMPLATE_EXT = {
+})
+FORMAT_TO_TEMPLATE_EXT = MappingProxyType({
     "json": ".json",
     "yaml": ".yaml",
-}
+})
+FORMAT_CHOICES = tuple(sorted(FORMAT_TO_TEMPLATE_EXT))
 
 DEFAULT_TEMPLATE_FORMAT = "json"
 DEFAULT_REPEAT_EVERY = "10m"
 DEFAULT_PROFILE_NAME = "default"
 
 VAR_PATTERN = re.compile(r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_.-]*)\s*\}\}")
-DURATION_CHUNKS_PATTERN = re.compile(r"(\d+(?:\.\d+)?)([smhd])")
+DURATION_CHUNKS_PATTERN = re.compile(r"(\d+(?:\.\d+)?)([smhd])", re.ASCII)
+FENCED_JSON_PATTERN = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+NAME_STOPWORDS = frozenset({
+    "a", "an", "and", "for", "from", "i", "is", "it", "of", "or",
+    "please", "role", "template", "that", "the", "this", "to", "want", "with",
+})
+NAME_MAX_WORDS = 5
+NAME_MAX_LENGTH = 48
 
+# A file or directory modified this recently may still change within the same mtime tick,
+# so cached results for it are not trusted for reuse (same idea as git's "racy" index entries).
+RACY_WINDOW_NS = 2_000_000_000
 
-@dataclass
+
+@dataclass(frozen=True)
 class RunnerConfig:
+    __slots__ = ("command", "args", "prompt_mode", "prompt_flag")
+
     command: str
-    args: list[str]
+    args: tuple[str, ...]
     prompt_mode: str
     prompt_flag: str
 
@@ -79,5 +94,6 @@ DEFAULT_CONFIG: dict[str, Any] = {
     },
 }
 
-REQUIRED_TEMPLATE_FIELDS = ["name", "description", "role_prompt", "instructions"]
-ALLOWED_SCOPES = {"general", "specific"}
+REQUIRED_TEMPLATE_FIELDS = ("name", "description", "role_prompt", "instructions")
+ALLOWED_SCOPES = frozenset({"general", "specific"})
+SCOPE_CHOICES = tuple(sorted(ALLOWED_SCOPES))
@@ -1,36 +1,76 @@
 from __future__ import annotations
 
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
 
-from .app_constants import CONFIG_DIR_NAME, CONFIG_FILE_NAME, TEMPLATES_DIR_NAME
+from .app_constants import CONFIG_DIR_NAME, CONFIG_FILE_NAME, RACY_WINDOW_NS, TEMPLATES_DIR_NAME
+
+# Roots that passed ensure_initialized, with their config directory's st_mtime_ns at the time.
+_INITIALIZED_ROOTS: dict[Path, int] = {}
+
+
+@lru_cache(maxsize=32)
+def _resolve_root_from(path: str | None, cwd: str) -> Path:
+    if path:
+        return (Path(cwd) / Path(path).expanduser()).resolve()
+    return Path(cwd).resolve()
 
 
 def resolve_root(path: str | None) -> Path:
-    return Path(path).expanduser().resolve() if path else Path.cwd().resolve()
+    return _resolve_root_from(path, os.getcwd())
 
 
+@lru_cache(maxsize=64)
 def config_dir(root: Path) -> Path:
     return root / CONFIG_DIR_NAME
 
 
+@lru_cache(maxsize=64)
 def templates_dir(root: Path) -> Path:
     return config_dir(root) / TEMPLATES_DIR_NAME
 
 
+@lru_cache(maxsize=64)
 def config_file(root: Path) -> Path:
     return config_dir(root) / CONFIG_FILE_NAME
 
 
+def _config_dir_entries(root: Path) -> set[str] | None:
+    try:
+        with os.scandir(config_dir(root)) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _config_dir_mtime_ns(root: Path) -> int | None:
+    try:
+        return os.stat(config_dir(root)).st_mtime_ns
+    except OSError:
+        return None
+
+
 def ensure_initialized(root: Path) -> None:
+    # Repeat calls cost one stat: adding or removing config.json or templates/ bumps the mtime.
+    mtime_ns = _config_dir_mtime_ns(root)
+    if mtime_ns is not None and _INITIALIZED_ROOTS.get(root) == mtime_ns:
+        return
+    _INITIALIZED_ROOTS.pop(root, None)
+    entries = _config_dir_entries(root)
     missing = []
-    if not config_dir(root).exists():
+    if entries is None:
         missing.append(str(config_dir(root)))
-    if not templates_dir(root).exists():
+        entries = set()
+    if TEMPLATES_DIR_NAME not in entries:
         missing.append(str(templates_dir(root)))
-    if not config_file(root).exists():
+    if CONFIG_FILE_NAME not in entries:
         missing.append(str(config_file(root)))
     if missing:
         joined = "\n - ".join([""] + missing)
         raise SystemExit(
             "Project is not initialized. Run `codexflow init` first. Missing:" + joined
         )
+    if mtime_ns is not None and time.time_ns() - mtime_ns > RACY_WINDOW_NS:
+        _INITIALIZED_ROOTS[root] = mtime_ns
@@ -1,32 +1,32 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 from typing import Any
 
 from ..core import (
     ALLOWED_SCOPES,
     build_ai_template_prompt,
     derive_template_name_from_request,
-    ensure_initialized,
     ensure_profile_exists,
     ensure_stem_not_ambiguous,
     extract_json_object,
-    load_config,
-    load_mapping_file,
     load_runner_profile,
+    load_template_normalized,
     maybe_resolve_existing_template_file,
     next_available_template_name,
-    normalize_template_data,
     parse_duration_seconds,
+    print_json,
+    remove_template,
     resolve_new_template_file,
-    resolve_root,
     run_runner_process,
     save_template,
-    split_template_name,
 )
 
 
+_GENERATED_TEXT_FIELDS = ("description", "role_prompt", "instructions")
+
+
 def _normalize_optional_text(value: Any) -> str | None:
     if value is None:
         return None
@@ -36,10 +36,13 @@ def _normalize_optional_text(value: Any) -> str | None:
     return text
 
 
+def _override_or_generated(override: str | None, generated: dict[str, Any], key: str) -> str | None:
+    return override.strip() if override else _normalize_optional_text(generated.get(key))
+
+
 def command_ai(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
-    ensure_initialized(root)
-    cfg = load_config(root)
+    ctx = args.ctx
+    root, cfg = ctx.root, ctx.cfg
     request = " ".join(args.request).strip()
     if not request:
         raise SystemExit("AI request cannot be empty.")
@@ -47,23 +50,23 @@ def command_ai(args: argparse.Namespace) -> int:
     template_name = args.name.strip() if args.name else next_available_template_name(
         root, derive_template_name_from_request(request)
     )
-    _, runner = load_runner_profile(root, args.runner_profile or cfg["default_profile"])
+    _, runner = load_runner_profile(root, args.runner_profile or cfg["default_profile"], cfg)
 
     existing_path = maybe_resolve_existing_template_file(root, template_name)
     if existing_path is None:
         mode = "create"
         source_template = None
-        target_path = resolve_new_template_file(root, template_name, args.format or cfg["default_template_format"])
-        target_stem, _ = split_template_name(template_name)
+        target_path, target_stem = resolve_new_template_file(
+            root, template_name, args.format or cfg["default_template_format"]
+        )
         ensure_stem_not_ambiguous(root, target_stem, target_path)
     else:
         mode = "update"
-        source_template = normalize_template_data(load_mapping_file(existing_path), fallback_name=existing_path.stem)
-        target_path = resolve_new_template_file(
+        source_template = load_template_normalized(existing_path)
+        target_path, target_stem = resolve_new_template_file(
             root, template_name, args.format, preserve_extension=existing_path.suffix.lower()
         )
-        target_stem, _ = split_template_name(template_name)
-        if target_path.exists() and target_path != existing_path:
+        if os.path.exists(target_path) and target_path != existing_path:
             raise SystemExit(f"Target file `{target_path.name}` already exists. Rename/delete it first.")
 
     if args.scope == "general" and args.specific_to:
@@ -91,13 +94,11 @@ def command_ai(args: argparse.Namespace) -> int:
         details = (proc.stderr or "").strip() or (proc.stdout or "").strip() or "(no output)"
         raise SystemExit(f"AI generation failed with exit code {proc.returncode}:\n{details}")
 
-    generated = extract_json_object((proc.stdout or "").strip() or (proc.stderr or "").strip())
-    data: dict[str, Any] = {
-        "name": target_stem,
-        "description": str(generated.get("description", "")).strip(),
-        "role_prompt": str(generated.get("role_prompt", "")).strip(),
-        "instructions": str(generated.get("instructions", "")).strip(),
-    }
+    stdout = proc.stdout or ""
+    generated = extract_json_object(stdout if stdout and not stdout.isspace() else proc.stderr or "")
+    data: dict[str, Any] = {"name": target_stem}
+    for field in _GENERATED_TEXT_FIELDS:
+        data[field] = str(generated.get(field, "")).strip()
     scope = (
         args.scope
         or ("specific" if args.specific_to else None)
@@ -108,10 +109,10 @@ def command_ai(args: argparse.Namespace) -> int:
         raise SystemExit("Generated template has invalid scope. Expected general or specific.")
     data["scope"] = scope
 
-    specific_to = args.specific_to.strip() if args.specific_to else _normalize_optional_text(generated.get("specific_to"))
-    if scope == "specific" and not specific_to:
-        raise SystemExit("Generated template scope is specific but specific_to is empty. Retry with --specific-to.")
-    if scope == "specific" and specific_to:
+    if scope == "specific":
+        specific_to = _override_or_generated(args.specific_to, generated, "specific_to")
+        if not specific_to:
+            raise SystemExit("Generated template scope is specific but specific_to is empty. Retry with --specific-to.")
         data["specific_to"] = specific_to
 
     bind_profile = args.bind_profile or _normalize_optional_text(generated.get("profile"))
@@ -119,23 +120,20 @@ def command_ai(args: argparse.Namespace) -> int:
         ensure_profile_exists(cfg, bind_profile)
         data["profile"] = bind_profile
 
-    repeat_for = args.repeat_for.strip() if args.repeat_for else _normalize_optional_text(generated.get("repeat_for"))
-    if repeat_for:
-        parse_duration_seconds(repeat_for, "repeat_for")
-        data["repeat_for"] = repeat_for
-    repeat_every = args.repeat_every.strip() if args.repeat_every else _normalize_optional_text(generated.get("repeat_every"))
-    if repeat_every:
-        parse_duration_seconds(repeat_every, "repeat_every")
-        data["repeat_every"] = repeat_every
-    if data.get("repeat_every") and not data.get("repeat_for"):
+    for field in ("repeat_for", "repeat_every"):
+        value = _override_or_generated(getattr(args, field), generated, field)
+        if value:
+            parse_duration_seconds(value, field)
+            data[field] = value
+    if "repeat_every" in data and "repeat_for" not in data:
         raise SystemExit("Generated template has repeat_every but repeat_for is missing. Retry with --repeat-for.")
 
     if args.dry_run:
-        print(json.dumps({"target_file": str(target_path), "template": data}, indent=2))
+        print_json({"target_file": str(target_path), "template": data})
         return 0
 
     save_template(target_path, data)
     if mode == "update" and existing_path is not None and target_path != existing_path:
-        existing_path.unlink()
+        remove_template(existing_path)
     print(f"{mode.title()}d template `{target_stem}` at {target_path}")
     return 0
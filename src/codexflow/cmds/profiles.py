@@ -1,48 +1,43 @@
 from __future__ import annotations
 
 import argparse
-import json
 
 from ..core import (
     FORMAT_TO_TEMPLATE_EXT,
-    ensure_initialized,
     list_template_files,
-    load_config,
-    load_mapping_file,
     normalize_template_data,
+    parse_mapping_bytes,
     parse_runner,
-    resolve_root,
-    save_config,
+    print_json,
+    validate_all_profiles,
 )
 
 
 def command_profile_list(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
-    ensure_initialized(root)
-    cfg = load_config(root)
+    ctx = args.ctx
+    cfg = ctx.cfg
     default_profile = cfg["default_profile"]
-    for name in sorted(cfg["profiles"].keys()):
+    runners = validate_all_profiles(cfg)
+    for name in sorted(runners):
         marker = "*" if name == default_profile else " "
-        profile = parse_runner(name, cfg["profiles"][name])
+        profile = runners[name]
         print(f"{marker} {name:14} cmd={profile.command} mode={profile.prompt_mode} args={len(profile.args)}")
     return 0
 
 
 def command_profile_show(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
-    ensure_initialized(root)
-    cfg = load_config(root)
+    ctx = args.ctx
+    cfg = ctx.cfg
     if args.name not in cfg["profiles"]:
         raise SystemExit(f"Profile `{args.name}` not found")
     out = {"name": args.name, "default": args.name == cfg["default_profile"], **cfg["profiles"][args.name]}
-    print(json.dumps(out, indent=2))
+    print_json(out)
     return 0
 
 
 def command_profile_add(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
-    ensure_initialized(root)
-    cfg = load_config(root)
+    ctx = args.ctx
+    cfg = ctx.cfg
     name = args.name.strip()
     if not name:
         raise SystemExit("Profile name cannot be empty")
@@ -57,54 +52,65 @@ def command_profile_add(args: argparse.Namespace) -> int:
     }
     parse_runner(name, profile_raw)
     cfg["profiles"][name] = profile_raw
-    save_config(root, cfg)
+    ctx.save_config(cfg)
     print(f"Saved profile `{name}`")
     return 0
 
 
+def _may_reference_profile(blob: bytes, needle: bytes) -> bool:
+    # Cheap byte check before parsing; escaped text (backslashes) always falls through to the parser,
+    # since an escaped key or name need not contain the literal bytes.
+    return b"\\" in blob or (b"profile" in blob and needle in blob)
+
+
 def command_profile_remove(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
-    ensure_initialized(root)
-    cfg = load_config(root)
+    ctx = args.ctx
+    cfg = ctx.cfg
     name = args.name
     if name not in cfg["profiles"]:
         raise SystemExit(f"Profile `{name}` not found")
     if name == cfg["default_profile"]:
         raise SystemExit(f"Profile `{name}` is the default profile. Set another default first.")
 
-    for path in list_template_files(root):
-        template = normalize_template_data(load_mapping_file(path), fallback_name=path.stem)
-        if str(template.get("profile", "")).strip() == name:
+    needle = name.encode("utf-8")
+    for path in list_template_files(ctx.root):
+        blob = path.read_bytes()
+        if not _may_reference_profile(blob, needle):
+            continue
+        raw = parse_mapping_bytes(path, blob)
+        profile = raw.get("profile")
+        if profile is None or str(profile).strip() != name:
+            continue
+        template = normalize_template_data(raw, fallback_name=path.stem)
+        if template.get("profile") == name:
             raise SystemExit(
                 f"Profile `{name}` is used by template `{template['name']}` ({path.name}). "
                 "Reassign or remove that template first."
             )
 
     del cfg["profiles"][name]
-    save_config(root, cfg)
+    ctx.save_config(cfg)
     print(f"Removed profile `{name}`")
     return 0
 
 
 def command_profile_default(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
-    ensure_initialized(root)
-    cfg = load_config(root)
+    ctx = args.ctx
+    cfg = ctx.cfg
     if args.name not in cfg["profiles"]:
         raise SystemExit(f"Profile `{args.name}` not found")
     cfg["default_profile"] = args.name
-    save_config(root, cfg)
+    ctx.save_config(cfg)
     print(f"Default profile set to `{args.name}`")
     return 0
 
 
 def command_profile_format(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
-    ensure_initialized(root)
-    cfg = load_config(root)
+    ctx = args.ctx
+    cfg = ctx.cfg
     if args.template_format not in FORMAT_TO_TEMPLATE_EXT:
         raise SystemExit("Template format must be `json` or `yaml`")
     cfg["default_template_format"] = args.template_format
-    save_config(root, cfg)
+    ctx.save_config(cfg)
     print(f"Default template format set to `{args.template_format}`")
     return 0
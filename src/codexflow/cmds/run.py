@@ -1,32 +1,55 @@
 from __future__ import annotations
 
 import argparse
+import signal
 import sys
+import threading
 import time
+from contextlib import contextmanager
+from typing import Iterator
 
 from ..core import (
     DEFAULT_REPEAT_EVERY,
+    RunnerConfig,
     build_prompt,
-    ensure_initialized,
-    load_config,
     load_runner_profile,
     load_template,
     parse_duration_seconds,
     parse_vars,
-    resolve_root,
     run_runner_process,
 )
 
 
+class _Terminated(Exception):
+    pass
+
+
+def _raise_terminated(signum: int, frame: object) -> None:
+    raise _Terminated
+
+
+@contextmanager
+def _sigterm_stops_loop() -> Iterator[None]:
+    # Turns SIGTERM into an exception so the sleep is cut short and a running
+    # child is killed and reaped by subprocess.run instead of being orphaned.
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    previous = signal.signal(signal.SIGTERM, _raise_terminated)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+
+
 def command_run(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
-    ensure_initialized(root)
-    cfg = load_config(root)
+    ctx = args.ctx
+    root, cfg = ctx.root, ctx.cfg
     _, template = load_template(root, args.name)
 
     template_profile = str(template.get("profile", "")).strip() or None
     selected_profile_name, runner = load_runner_profile(
-        root, args.profile or template_profile or cfg["default_profile"]
+        root, args.profile or template_profile or cfg["default_profile"], cfg
     )
 
     prompt, missing = build_prompt(
@@ -77,6 +100,22 @@ def command_run(args: argparse.Namespace) -> int:
 
     if not repeat_for_seconds:
         return int(run_runner_process(runner, prompt, print_command=args.print_command).returncode)
+    try:
+        with _sigterm_stops_loop():
+            return _run_repeated(args, runner, prompt, repeat_for_seconds, repeat_every_seconds, repeat_every_value)
+    except _Terminated:
+        print("[codexflow] received SIGTERM, stopping", file=sys.stderr)
+        return 128 + int(signal.SIGTERM)
+
+
+def _run_repeated(
+    args: argparse.Namespace,
+    runner: RunnerConfig,
+    prompt: str,
+    repeat_for_seconds: float,
+    repeat_every_seconds: float | None,
+    repeat_every_value: str | None,
+) -> int:
     end_time = time.monotonic() + repeat_for_seconds
     run_index = 0
     last_nonzero = 0
@@ -1,38 +1,33 @@
 from __future__ import annotations
 
 import argparse
+import os
 from typing import Any
 
 from ..core import (
     FORMAT_TO_TEMPLATE_EXT,
-    ensure_initialized,
     ensure_profile_exists,
     ensure_stem_not_ambiguous,
-    load_config,
     load_template,
     parse_duration_seconds,
     read_text_arg_or_file,
     resolve_new_template_file,
-    resolve_root,
     save_template,
-    split_template_name,
 )
 
 
 def command_create(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
-    ensure_initialized(root)
-    cfg = load_config(root)
+    ctx = args.ctx
+    root, cfg = ctx.root, ctx.cfg
     selected_profile = args.profile.strip() if args.profile else None
     if selected_profile:
         ensure_profile_exists(cfg, selected_profile)
     chosen_format = args.format or cfg["default_template_format"]
     if chosen_format not in FORMAT_TO_TEMPLATE_EXT:
         raise SystemExit("--format must be `json` or `yaml`")
-    output_path = resolve_new_template_file(root, args.name, chosen_format)
-    stem, _ = split_template_name(args.name)
+    output_path, stem = resolve_new_template_file(root, args.name, chosen_format)
     ensure_stem_not_ambiguous(root, stem, output_path)
-    if output_path.exists() and not args.force:
+    if os.path.exists(output_path) and not args.force:
         raise SystemExit(f"Template `{args.name}` already exists at {output_path}. Use --force to overwrite.")
 
     scope = args.scope
@@ -73,10 +68,10 @@ def command_create(args: argparse.Namespace) -> int:
 
 
 def command_edit(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
-    ensure_initialized(root)
-    cfg = load_config(root)
+    ctx = args.ctx
+    root, cfg = ctx.root, ctx.cfg
     path, data = load_template(root, args.name)
+    original = dict(data)
     changed = False
     if args.clear_repeat and (args.repeat_for is not None or args.repeat_every is not None):
         raise SystemExit("Cannot use --clear-repeat with --repeat-for/--repeat-every")
@@ -129,6 +124,7 @@ def command_edit(args: argparse.Namespace) -> int:
     if data.get("repeat_every") and not data.get("repeat_for"):
         raise SystemExit("Template has repeat_every but repeat_for is missing")
 
-    save_template(path, data)
+    if data != original:
+        save_template(path, data)
     print(f"Updated template `{data['name']}` ({path.name})")
     return 0
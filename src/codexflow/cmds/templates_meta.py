@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 
 from ..core import (
     DEFAULT_CONFIG,
@@ -12,26 +12,23 @@ from ..core import (
     cadence_text,
     config_dir,
     config_file,
-    ensure_initialized,
     list_template_files,
-    load_config,
-    load_mapping_file,
     load_template,
-    normalize_template_data,
+    load_template_normalized,
+    print_json,
     resolve_new_template_file,
-    resolve_root,
     save_json,
-    save_template,
+    save_template_prevalidated,
     scope_text,
     templates_dir,
 )
 
 
 def command_init(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
+    root = args.ctx.root
     cdir = config_dir(root)
     tdir = templates_dir(root)
-    if cdir.exists() and not args.force:
+    if os.path.exists(cdir) and not args.force:
         raise SystemExit(
             f"{cdir} already exists. Use --force to overwrite starter config/templates."
         )
@@ -39,8 +36,9 @@ def command_init(args: argparse.Namespace) -> int:
     tdir.mkdir(parents=True, exist_ok=True)
     save_json(config_file(root), DEFAULT_CONFIG)
     for name, template in STARTER_TEMPLATES.items():
-        path = resolve_new_template_file(root, name, DEFAULT_TEMPLATE_FORMAT)
-        save_template(
+        path, _ = resolve_new_template_file(root, name, DEFAULT_TEMPLATE_FORMAT)
+        # Starter text is stored stripped and in field order, i.e. already normalized.
+        save_template_prevalidated(
             path,
             {
                 "name": name,
@@ -56,15 +54,14 @@ def command_init(args: argparse.Namespace) -> int:
 
 
 def command_list(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
-    ensure_initialized(root)
-    cfg = load_config(root)
+    ctx = args.ctx
+    root, cfg = ctx.root, ctx.cfg
     files = list_template_files(root)
     if not files:
         print("No templates found.")
         return 0
     for path in files:
-        data = normalize_template_data(load_mapping_file(path), fallback_name=path.stem)
+        data = load_template_normalized(path)
         profile = data.get("profile", cfg["default_profile"])
         template_format = TEMPLATE_EXT_TO_FORMAT[path.suffix.lower()]
         print(
@@ -74,9 +71,8 @@ def command_list(args: argparse.Namespace) -> int:
 
 
 def command_show(args: argparse.Namespace) -> int:
-    root = resolve_root(args.root)
-    ensure_initialized(root)
+    root = args.ctx.root
     path, data = load_template(root, args.name)
     out = {**data, "file": path.name, "format": TEMPLATE_EXT_TO_FORMAT[path.suffix.lower()]}
-    print(json.dumps(out, indent=2))
+    print_json(out)
     return 0
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .app_paths import ensure_initialized, resolve_root
+from .config_ops import load_config, save_config
+
+
+@dataclass
+class CommandContext:
+    root: Path
+    _cfg: dict[str, Any] | None = field(default=None, repr=False)
+
+    @property
+    def cfg(self) -> dict[str, Any]:
+        if self._cfg is None:
+            self._cfg = load_config(self.root)
+        return self._cfg
+
+    def save_config(self, cfg: dict[str, Any]) -> None:
+        save_config(self.root, cfg)
+        self._cfg = None
+
+
+def build_command_context(args: argparse.Namespace) -> CommandContext:
+    # Built once in main() and passed to commands as args.ctx; only `init` runs uninitialized.
+    root = resolve_root(args.root)
+    if getattr(args, "requires_init", True):
+        ensure_initialized(root)
+    return CommandContext(root)
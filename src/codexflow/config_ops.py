@@ -28,7 +28,7 @@ def parse_runner(name: str, raw: dict[str, Any]) -> RunnerConfig:
     prompt_flag = str(raw.get("prompt_flag", "--prompt")).strip() or "--prompt"
     return RunnerConfig(
         command=command,
-        args=[str(item) for item in args],
+        args=tuple(str(item) for item in args),
         prompt_mode=prompt_mode,
         prompt_flag=prompt_flag,
     )
@@ -54,7 +54,7 @@ def normalized_config(raw: dict[str, Any]) -> dict[str, Any]:
         return {
             "default_profile": default_profile,
             "default_template_format": default_template_format,
-            "profiles": profiles,
+            "profiles": dict(profiles),
         }
     if "runner" in raw:
         return {
@@ -68,18 +68,22 @@ def normalized_config(raw: dict[str, Any]) -> dict[str, Any]:
 
 
 def load_config(root: Path) -> dict[str, Any]:
-    cfg = normalized_config(load_json(config_file(root)))
-    for name, profile in cfg["profiles"].items():
-        parse_runner(name, profile)
-    return cfg
+    return normalized_config(load_json(config_file(root)))
+
+
+def validate_all_profiles(cfg: dict[str, Any]) -> dict[str, RunnerConfig]:
+    return {name: parse_runner(name, profile) for name, profile in cfg["profiles"].items()}
 
 
 def save_config(root: Path, cfg: dict[str, Any]) -> None:
     save_json(config_file(root), cfg)
 
 
-def load_runner_profile(root: Path, profile_name: str | None) -> tuple[str, RunnerConfig]:
-    cfg = load_config(root)
+def load_runner_profile(
+    root: Path, profile_name: str | None, cfg: dict[str, Any] | None = None
+) -> tuple[str, RunnerConfig]:
+    if cfg is None:
+        cfg = load_config(root)
     selected_name = profile_name or cfg["default_profile"]
     profiles = cfg["profiles"]
     if selected_name not in profiles:
@@ -14,18 +14,36 @@ from .app_constants import (
     DEFAULT_REPEAT_EVERY,
     DEFAULT_TEMPLATE_FORMAT,
     DURATION_CHUNKS_PATTERN,
+    FORMAT_CHOICES,
     FORMAT_TO_TEMPLATE_EXT,
     REQUIRED_TEMPLATE_FIELDS,
     RunnerConfig,
+    SCOPE_CHOICES,
     STARTER_TEMPLATES,
     TEMPLATE_EXT_TO_FORMAT,
     TEMPLATES_DIR_NAME,
     VAR_PATTERN,
 )
 from .app_paths import config_dir, config_file, ensure_initialized, resolve_root, templates_dir
-from .config_ops import load_config, load_runner_profile, normalized_config, parse_runner, save_config
+from .command_context import CommandContext, build_command_context
+from .config_ops import (
+    load_config,
+    load_runner_profile,
+    normalized_config,
+    parse_runner,
+    save_config,
+    validate_all_profiles,
+)
+from .json_codec import dumps_indented, print_json
 from .mapping_io import load_json, parse_simple_yaml, parse_simple_yaml_scalar, save_json
-from .mapping_yaml_dump import dump_simple_yaml, load_mapping_file, save_mapping_file
+from .mapping_yaml_dump import (
+    dump_simple_yaml,
+    load_derived_mapping,
+    load_mapping_file,
+    parse_mapping_bytes,
+    remove_mapping_file,
+    save_mapping_file,
+)
 from .prompting import (
     build_prompt,
     ensure_profile_exists,
@@ -43,9 +61,12 @@ from .runner_utils import (
 from .template_logic import (
     cadence_text,
     load_template,
+    load_template_normalized,
     normalize_template_data,
     parse_duration_seconds,
+    remove_template,
     save_template,
+    save_template_prevalidated,
     scope_text,
 )
 from .template_paths import (
@@ -54,5 +75,6 @@ from .template_paths import (
     resolve_existing_template_file,
     resolve_new_template_file,
     split_template_name,
+    template_stems,
     validate_template_name_input,
 )
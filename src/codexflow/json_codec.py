@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import json
+from json import JSONDecodeError
+from typing import Any
+
+__all__ = ["JSONDecodeError", "dumps_indented", "loads", "print_json"]
+
+# Shared instances with the stdlib defaults, so output matches json.dumps(indent=2).
+_ENCODER = json.JSONEncoder()
+_INDENTED_ENCODER = json.JSONEncoder(indent=2)
+_DECODER = json.JSONDecoder()
+
+
+def loads(data: str | bytes) -> Any:
+    if isinstance(data, bytes):
+        data = data.decode(json.detect_encoding(data), "surrogatepass")
+    return _DECODER.decode(data)
+
+
+def dumps_indented(data: Any) -> str:
+    # Same output as _INDENTED_ENCODER; flat maps skip the pure-Python indenting encoder.
+    if not isinstance(data, dict) or not data or any(
+        not isinstance(key, str) or isinstance(value, (dict, list, tuple))
+        for key, value in data.items()
+    ):
+        return _INDENTED_ENCODER.encode(data)
+    encode = _ENCODER.encode
+    return "{\n" + ",\n".join(f"  {encode(key)}: {encode(value)}" for key, value in data.items()) + "\n}"
+
+
+def print_json(data: Any) -> None:
+    print(dumps_indented(data))
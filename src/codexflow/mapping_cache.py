@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from .app_constants import RACY_WINDOW_NS
+
+Derive = Callable[[Path, dict[str, Any]], dict[str, Any]]
+
+# Values derived from parsed mapping files (e.g. normalized templates), keyed by path and
+# validated against (st_mtime_ns, st_size). Plain loads are not cached: a parse is about as
+# cheap as copying its result, and a one-shot CLI run rarely loads the same file twice.
+_DERIVED_CACHE: dict[Path, tuple[int, int, dict[Derive, dict[str, Any]]]] = {}
+
+
+def cached_derived(
+    path: Path, parse: Callable[[Path], dict[str, Any]], derive: Derive
+) -> dict[str, Any]:
+    # derive must return a flat map of immutable values, so a shallow copy isolates callers.
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        _DERIVED_CACHE.pop(path, None)
+        raise
+    entry = _DERIVED_CACHE.get(path)
+    if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+        entry = (stat.st_mtime_ns, stat.st_size, {})
+    value = entry[2].get(derive)
+    if value is None:
+        value = derive(path, parse(path))
+        entry[2][derive] = value
+    # A same-size rewrite within one mtime tick would go unnoticed, so recent files stay uncached.
+    if time.time_ns() - stat.st_mtime_ns > RACY_WINDOW_NS:
+        _DERIVED_CACHE[path] = entry
+    else:
+        _DERIVED_CACHE.pop(path, None)
+    return dict(value)
+
+
+def forget_cached_mapping(path: Path) -> None:
+    _DERIVED_CACHE.pop(path, None)
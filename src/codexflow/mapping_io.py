@@ -1,41 +1,99 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
-try:
-    import yaml  # type: ignore
-except Exception:  # pragma: no cover
-    yaml = None
+from .json_codec import JSONDecodeError, dumps_indented, loads
+from .mapping_cache import forget_cached_mapping
+
+
+def write_atomic(path: Path, payload: bytes) -> None:
+    # Sibling temp file + fsync + os.replace: readers see the old or the new file, never a partial one.
+    # Symlinks are resolved first so the link survives and its target gets the new content.
+    path = Path(os.path.realpath(path))
+    tmp = path.with_name(f".{path.name}.{os.urandom(4).hex()}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        _copy_ownership(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _copy_ownership(source: Path, target: Path) -> None:
+    try:
+        stat = os.stat(source)
+    except FileNotFoundError:
+        return
+    # Owner first: chown may clear setuid/setgid bits that the chmod then restores.
+    if hasattr(os, "chown"):
+        try:
+            os.chown(target, stat.st_uid, stat.st_gid)
+        except OSError:
+            pass
+    os.chmod(target, stat.st_mode & 0o7777)
+
+
+def write_utf8(path: Path, text: str) -> None:
+    write_atomic(path, text.encode("utf-8"))
+
+
+def write_utf8_if_changed(path: Path, text: str) -> bool:
+    encoded = text.encode("utf-8")
+    try:
+        if path.read_bytes() == encoded:
+            return False
+    except OSError:
+        pass
+    forget_cached_mapping(path)
+    write_atomic(path, encoded)
+    return True
 
 
 def load_json(path: Path) -> dict[str, Any]:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        out = loads(path.read_bytes())
+    except JSONDecodeError as exc:
         raise SystemExit(f"Invalid JSON in {path}: {exc}") from exc
+    if not isinstance(out, dict):
+        raise SystemExit(f"JSON file {path} must contain an object/map")
+    return out
 
 
 def save_json(path: Path, data: dict[str, Any]) -> None:
-    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    forget_cached_mapping(path)
+    write_utf8(path, dumps_indented(data) + "\n")
+
+
+_SCALAR_LITERALS: dict[str, Any] = {"null": None, "~": None, "true": True, "false": False}
+_MISSING = object()
 
 
 def parse_simple_yaml_scalar(token: str) -> Any:
-    if token in {"null", "~"}:
-        return None
-    if token == "true":
-        return True
-    if token == "false":
-        return False
-    if token.startswith('"') and token.endswith('"'):
-        try:
-            return json.loads(token)
-        except json.JSONDecodeError:
-            return token[1:-1]
-    if token.startswith("'") and token.endswith("'"):
-        return token[1:-1].replace("''", "'")
-    if token.startswith("[") or token.startswith("{"):
+    literal = _SCALAR_LITERALS.get(token, _MISSING)
+    if literal is not _MISSING:
+        return literal
+    first = token[:1]
+    if first == '"':
+        if token.endswith('"'):
+            try:
+                return json.loads(token)
+            except json.JSONDecodeError:
+                return token[1:-1]
+    elif first == "'":
+        if token.endswith("'"):
+            return token[1:-1].replace("''", "'")
+    elif first == "[" or first == "{":
         try:
             return json.loads(token)
         except json.JSONDecodeError:
@@ -46,36 +104,28 @@ def parse_simple_yaml_scalar(token: str) -> Any:
 def parse_simple_yaml(text: str) -> dict[str, Any]:
     data: dict[str, Any] = {}
     lines = text.splitlines()
+    count = len(lines)
     i = 0
-    while i < len(lines):
+    while i < count:
         line = lines[i]
         i += 1
         stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
+        if not stripped or stripped[0] == "#":
             continue
-        if line.startswith(" "):
+        if line[:1] == " ":
             raise SystemExit("Unsupported YAML indentation in fallback parser")
-        if ":" not in line:
+        colon = line.find(":")
+        if colon < 0:
             raise SystemExit(f"Invalid YAML line: {line}")
-        key, raw = line.split(":", 1)
-        key = key.strip()
-        raw = raw.strip()
+        key = line[:colon].strip()
         if not key:
             raise SystemExit("Invalid YAML key")
-        if raw in {"|", "|-"}:
-            block: list[str] = []
-            while i < len(lines):
-                next_line = lines[i]
-                if next_line.startswith("  "):
-                    block.append(next_line[2:])
-                    i += 1
-                    continue
-                if next_line == "":
-                    block.append("")
-                    i += 1
-                    continue
-                break
-            data[key] = "\n".join(block).rstrip("\n")
+        raw = line[colon + 1:].strip()
+        if raw == "|" or raw == "|-":
+            start = i
+            while i < count and (lines[i][:2] == "  " or not lines[i]):
+                i += 1
+            data[key] = "\n".join(block[2:] for block in lines[start:i]).rstrip("\n")
             continue
         data[key] = parse_simple_yaml_scalar(raw)
     return data
@@ -1,66 +1,103 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from .mapping_io import parse_simple_yaml
+from .json_codec import JSONDecodeError, dumps_indented, loads
+from .mapping_cache import Derive, cached_derived, forget_cached_mapping
+from .mapping_io import parse_simple_yaml, write_utf8_if_changed
 
-try:
-    import yaml  # type: ignore
-except Exception:  # pragma: no cover
-    yaml = None
+
+@lru_cache(maxsize=1)
+def _yaml_module() -> Any:
+    # PyYAML is only imported once a YAML template is actually read or written.
+    try:
+        import yaml  # type: ignore
+    except Exception:  # pragma: no cover
+        return None
+    return yaml
+
+
+_SCALAR_ENCODER = json.JSONEncoder()
 
 
 def dump_simple_yaml(data: dict[str, Any]) -> str:
+    encode = _SCALAR_ENCODER.encode
     lines: list[str] = []
     for key, value in data.items():
         if value is None:
             lines.append(f"{key}: null")
-            continue
-        if isinstance(value, bool):
+        elif isinstance(value, bool):
             lines.append(f"{key}: {'true' if value else 'false'}")
-            continue
-        if isinstance(value, str):
-            if "\n" in value:
-                lines.append(f"{key}: |-")
-                for line in value.split("\n"):
-                    lines.append(f"  {line}")
-            else:
-                lines.append(f"{key}: {json.dumps(value)}")
-            continue
-        lines.append(f"{key}: {json.dumps(value)}")
+        elif isinstance(value, str) and "\n" in value:
+            lines.append(f"{key}: |-\n  " + "\n  ".join(value.split("\n")))
+        else:
+            lines.append(f"{key}: {encode(value)}")
     return "\n".join(lines) + "\n"
 
 
-def load_mapping_file(path: Path) -> dict[str, Any]:
+def _parse_json_bytes(path: Path, raw: bytes) -> Any:
+    try:
+        return loads(raw)
+    except JSONDecodeError as exc:
+        raise SystemExit(f"Invalid JSON in {path}: {exc}") from exc
+
+
+def _parse_yaml_bytes(path: Path, raw: bytes) -> Any:
+    text = raw.decode("utf-8")
+    yaml = _yaml_module()
+    return yaml.safe_load(text) if yaml is not None else parse_simple_yaml(text)
+
+
+def _dump_json_text(data: dict[str, Any]) -> str:
+    return dumps_indented(data) + "\n"
+
+
+def _dump_yaml_text(data: dict[str, Any]) -> str:
+    yaml = _yaml_module()
+    if yaml is not None:
+        return yaml.safe_dump(data, sort_keys=False, allow_unicode=False)
+    return dump_simple_yaml(data)
+
+
+_PARSERS = {".json": _parse_json_bytes, ".yaml": _parse_yaml_bytes, ".yml": _parse_yaml_bytes}
+_DUMPERS = {".json": _dump_json_text, ".yaml": _dump_yaml_text, ".yml": _dump_yaml_text}
+
+
+def parse_mapping_bytes(path: Path, raw: bytes) -> dict[str, Any]:
+    # For callers that already hold the file's bytes; path picks the format and names errors.
     ext = path.suffix.lower()
-    text = path.read_text(encoding="utf-8")
-    if ext == ".json":
-        try:
-            out = json.loads(text)
-        except json.JSONDecodeError as exc:
-            raise SystemExit(f"Invalid JSON in {path}: {exc}") from exc
-    elif ext in {".yaml", ".yml"}:
-        out = yaml.safe_load(text) if yaml is not None else parse_simple_yaml(text)
-    else:
+    parse = _PARSERS.get(ext)
+    if parse is None:
         raise SystemExit(f"Unsupported template extension: {ext}")
+    out = parse(path, raw)
     if not isinstance(out, dict):
         raise SystemExit(f"Template file {path} must contain an object/map")
     return out
 
 
-def save_mapping_file(path: Path, data: dict[str, Any]) -> None:
+def _parse_mapping_file(path: Path) -> dict[str, Any]:
+    return parse_mapping_bytes(path, path.read_bytes())
+
+
+def load_mapping_file(path: Path) -> dict[str, Any]:
+    return _parse_mapping_file(path)
+
+
+def load_derived_mapping(path: Path, derive: Derive) -> dict[str, Any]:
+    return cached_derived(path, _parse_mapping_file, derive)
+
+
+def save_mapping_file(path: Path, data: dict[str, Any]) -> bool:
     ext = path.suffix.lower()
-    if ext == ".json":
-        path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
-        return
-    if ext in {".yaml", ".yml"}:
-        text = (
-            yaml.safe_dump(data, sort_keys=False, allow_unicode=False)
-            if yaml is not None
-            else dump_simple_yaml(data)
-        )
-        path.write_text(text, encoding="utf-8")
-        return
-    raise SystemExit(f"Unsupported template extension: {ext}")
+    dump = _DUMPERS.get(ext)
+    if dump is None:
+        raise SystemExit(f"Unsupported template extension: {ext}")
+    return write_utf8_if_changed(path, dump(data))
+
+
+def remove_mapping_file(path: Path) -> None:
+    forget_cached_mapping(path)
+    path.unlink()
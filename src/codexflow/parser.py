@@ -1,13 +1,34 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 
-from .parser_parts.ai_run import register_ai_and_run_commands
-from .parser_parts.profiles import register_profile_commands
-from .parser_parts.templates import register_template_commands
+from .parser_parts.ai_run import AI_RUN_COMMANDS
+from .parser_parts.profiles import PROFILE_COMMANDS
+from .parser_parts.templates import TEMPLATE_COMMANDS
 
+SUBCOMMAND_BUILDERS = {**TEMPLATE_COMMANDS, **AI_RUN_COMMANDS, **PROFILE_COMMANDS}
+_COMMAND_METAVAR = "{" + ",".join(SUBCOMMAND_BUILDERS) + "}"
 
-def build_parser() -> argparse.ArgumentParser:
+
+def requested_command(argv: list[str]) -> str | None:
+    # First positional token, skipping `--root VALUE`; any other option means "build everything".
+    tokens = iter(argv)
+    for token in tokens:
+        if token == "--root":
+            next(tokens, None)
+        elif token.startswith("--root="):
+            continue
+        elif token.startswith("-"):
+            return None
+        else:
+            return token
+    return None
+
+
+@lru_cache(maxsize=None)
+def _cached_parser(command: str | None) -> argparse.ArgumentParser:
+    # parse_args does not mutate the parser, so one instance per command serves every call.
     parser = argparse.ArgumentParser(
         prog="codexflow",
         description="Template-driven CLI for role-based coding automation.",
@@ -17,8 +38,17 @@ def build_parser() -> argparse.ArgumentParser:
         help="Project root where .codexflow lives (defaults to current directory).",
     )
 
+    if command is not None:
+        # Same usage line as the full parser, though only one command is registered.
+        subparsers = parser.add_subparsers(dest="command", required=True, metavar=_COMMAND_METAVAR)
+        SUBCOMMAND_BUILDERS[command](subparsers)
+        return parser
     subparsers = parser.add_subparsers(dest="command", required=True)
-    register_template_commands(subparsers)
-    register_ai_and_run_commands(subparsers)
-    register_profile_commands(subparsers)
+    for add in SUBCOMMAND_BUILDERS.values():
+        add(subparsers)
     return parser
+
+
+def build_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    command = requested_command(argv) if argv is not None else None
+    return _cached_parser(command if command in SUBCOMMAND_BUILDERS else None)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from argparse import _SubParsersAction
+from typing import Callable
 
 from ..commands import command_ai, command_run
-from ..core import ALLOWED_SCOPES, FORMAT_TO_TEMPLATE_EXT
+from ..core import FORMAT_CHOICES, SCOPE_CHOICES
 
 
-def register_ai_and_run_commands(subparsers: _SubParsersAction) -> None:
+def _add_ai(subparsers: _SubParsersAction) -> None:
     p_ai = subparsers.add_parser(
         "ai",
         help="Use the runner (e.g. codex) to create or update a template from a natural-language request.",
@@ -15,15 +16,17 @@ def register_ai_and_run_commands(subparsers: _SubParsersAction) -> None:
     p_ai.add_argument("--name", help="Optional template name. If omitted, a name is auto-generated from the request.")
     p_ai.add_argument("--runner-profile", help="Runner profile used for AI generation (defaults to config default profile).")
     p_ai.add_argument("--bind-profile", help="Bind generated template to this profile.")
-    p_ai.add_argument("--scope", choices=sorted(ALLOWED_SCOPES), help="Force generated scope (general or specific).")
+    p_ai.add_argument("--scope", choices=SCOPE_CHOICES, help="Force generated scope (general or specific).")
     p_ai.add_argument("--specific-to", help="Force specific target (used with or implies specific scope).")
     p_ai.add_argument("--repeat-for", help="Force default runtime window for repeated execution in generated template.")
     p_ai.add_argument("--repeat-every", help="Force default repeat interval in generated template.")
-    p_ai.add_argument("--format", choices=sorted(FORMAT_TO_TEMPLATE_EXT.keys()), help="Target template format (json or yaml). For update, can convert format.")
+    p_ai.add_argument("--format", choices=FORMAT_CHOICES, help="Target template format (json or yaml). For update, can convert format.")
     p_ai.add_argument("--dry-run", action="store_true", help="Show generated template JSON without saving.")
     p_ai.add_argument("--print-command", action="store_true", help="Print runner command before execution.")
     p_ai.set_defaults(func=command_ai)
 
+
+def _add_run(subparsers: _SubParsersAction) -> None:
     p_run = subparsers.add_parser("run", help="Run a template against a task.")
     p_run.add_argument("name", help="Template name.")
     p_run.add_argument("task", help="Task text.")
@@ -38,3 +41,9 @@ def register_ai_and_run_commands(subparsers: _SubParsersAction) -> None:
     p_run.add_argument("--dry-run", action="store_true", help="Print composed prompt only. Does not execute runner command.")
     p_run.add_argument("--print-command", action="store_true", help="Print external command before execution.")
     p_run.set_defaults(func=command_run)
+
+
+AI_RUN_COMMANDS: dict[str, Callable[[_SubParsersAction], None]] = {
+    "ai": _add_ai,
+    "run": _add_run,
+}
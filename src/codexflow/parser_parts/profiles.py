@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from argparse import _SubParsersAction
+from typing import Callable
 
 from ..commands import (
     command_profile_add,
@@ -10,7 +11,7 @@ from ..commands import (
     command_profile_remove,
     command_profile_show,
 )
-from ..core import FORMAT_TO_TEMPLATE_EXT
+from ..core import FORMAT_CHOICES
 
 
 def register_profile_commands(subparsers: _SubParsersAction) -> None:
@@ -42,5 +43,10 @@ def register_profile_commands(subparsers: _SubParsersAction) -> None:
     p_profile_default.set_defaults(func=command_profile_default)
 
     p_profile_format = profile_sub.add_parser("default-format", help="Set default template file format for new templates.")
-    p_profile_format.add_argument("template_format", choices=sorted(FORMAT_TO_TEMPLATE_EXT.keys()), help="json or yaml")
+    p_profile_format.add_argument("template_format", choices=FORMAT_CHOICES, help="json or yaml")
     p_profile_format.set_defaults(func=command_profile_format)
+
+
+PROFILE_COMMANDS: dict[str, Callable[[_SubParsersAction], None]] = {
+    "profile": register_profile_commands,
+}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,9 +12,9 @@ from .template_paths import find_template_files_by_stem
 def parse_vars(items: list[str]) -> dict[str, str]:
     out: dict[str, str] = {}
     for item in items:
-        if "=" not in item:
+        key, sep, value = item.partition("=")
+        if not sep:
             raise SystemExit(f"Invalid --var `{item}`. Expected KEY=VALUE")
-        key, value = item.split("=", 1)
         key = key.strip()
         if not key:
             raise SystemExit(f"Invalid --var `{item}`. Empty key")
@@ -21,17 +22,53 @@ def parse_vars(items: list[str]) -> dict[str, str]:
     return out
 
 
-def render_text_with_vars(text: str, variables: dict[str, str]) -> tuple[str, set[str]]:
-    missing: set[str] = set()
+@lru_cache(maxsize=256)
+def _split_placeholders(text: str) -> tuple[tuple[str, ...], tuple[tuple[str, str], ...]]:
+    literals: list[str] = []
+    placeholders: list[tuple[str, str]] = []
+    pos = 0
+    for match in VAR_PATTERN.finditer(text):
+        literals.append(text[pos:match.start()])
+        placeholders.append((match.group(0), match.group(1)))
+        pos = match.end()
+    literals.append(text[pos:])
+    return tuple(literals), tuple(placeholders)
 
-    def repl(match: Any) -> str:
-        key = match.group(1)
-        if key in variables:
-            return variables[key]
-        missing.add(key)
-        return match.group(0)
 
-    return VAR_PATTERN.sub(repl, text), missing
+def render_text_with_vars(
+    text: str, variables: dict[str, str], missing: set[str] | None = None
+) -> tuple[str, set[str]]:
+    if missing is None:
+        missing = set()
+    # Free-form task/extra text rarely has placeholders; keep it out of the split cache.
+    if "{{" not in text:
+        return text, missing
+    literals, placeholders = _split_placeholders(text)
+    if not placeholders:
+        return text, missing
+    out = [literals[0]]
+    for (token, key), literal in zip(placeholders, literals[1:]):
+        if key in variables:
+            out.append(variables[key])
+        else:
+            missing.add(key)
+            out.append(token)
+        out.append(literal)
+    return "".join(out), missing
+
+
+_PROMPT_LAYOUT = (
+    "Role: {name}\n"
+    "Description: {description}\n"
+    "Scope: {scope}\n"
+    "Profile: {profile}\n"
+    "\n"
+    "Role instructions:\n{role_prompt}\n"
+    "\n"
+    "Execution rules:\n{instructions}\n"
+    "\n"
+    "Task:\n{task}"
+)
 
 
 def build_prompt(
@@ -53,40 +90,36 @@ def build_prompt(
         "root": str(root),
     }
     variables = {**base_vars, **user_vars}
-    role_prompt, miss_role = render_text_with_vars(template["role_prompt"], variables)
-    instructions, miss_inst = render_text_with_vars(template["instructions"], variables)
-    task_text, miss_task = render_text_with_vars(task.strip(), variables)
+    missing: set[str] = set()
+    role_prompt, _ = render_text_with_vars(template["role_prompt"], variables, missing)
+    instructions, _ = render_text_with_vars(template["instructions"], variables, missing)
+    task_text, _ = render_text_with_vars(task.strip(), variables, missing)
     extra_text = ""
-    miss_extra: set[str] = set()
     if extra and extra.strip():
-        extra_text, miss_extra = render_text_with_vars(extra.strip(), variables)
-    parts = [
-        f"Role: {template['name']}",
-        f"Description: {template['description']}",
-        f"Scope: {scope_text(template)}",
-        f"Profile: {selected_profile}",
-        "",
-        "Role instructions:",
-        role_prompt,
-        "",
-        "Execution rules:",
-        instructions,
-        "",
-        "Task:",
-        task_text,
-    ]
+        extra_text, _ = render_text_with_vars(extra.strip(), variables, missing)
+    prompt = _PROMPT_LAYOUT.format(
+        name=template["name"],
+        description=template["description"],
+        scope=scope_text(template),
+        profile=selected_profile,
+        role_prompt=role_prompt,
+        instructions=instructions,
+        task=task_text,
+    )
     if extra_text:
-        parts.extend(["", "Extra context:", extra_text])
-    missing = miss_role | miss_inst | miss_task | miss_extra
-    return "\n".join(parts).strip() + "\n", missing
+        prompt = f"{prompt}\n\nExtra context:\n{extra_text}"
+    return prompt.rstrip() + "\n", missing
 
 
 def read_text_arg_or_file(value: str) -> str:
     if value.startswith("@"):
         path = Path(value[1:]).expanduser()
-        if not path.exists():
-            raise SystemExit(f"File not found: {path}")
-        return path.read_text(encoding="utf-8")
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError as exc:
+            raise SystemExit(f"File not found: {path}") from exc
+        # Same newline translation as text-mode reads, without the TextIOWrapper.
+        return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
     return value
 
 
@@ -1,18 +1,34 @@
 from __future__ import annotations
 
+import errno
 import json
-import re
-import shlex
-import shutil
-import subprocess
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .app_constants import RunnerConfig
+from .app_constants import FENCED_JSON_PATTERN, RunnerConfig
 from .app_paths import templates_dir
+from .json_codec import JSONDecodeError, loads
 from .template_paths import find_template_files_by_stem, split_template_name
 
+if TYPE_CHECKING:
+    import subprocess
+
+_RAW_DECODER = json.JSONDecoder()
+
+
+@lru_cache(maxsize=32)
+def _which(command: str, search_path: str | None) -> str | None:
+    import shutil
+
+    return shutil.which(command, path=search_path)
+
+
+def resolve_runner_command(command: str) -> str | None:
+    return _which(command, os.environ.get("PATH"))
+
 
 def build_subprocess_command(
     runner: RunnerConfig, prompt: str
@@ -32,11 +48,14 @@ def run_runner_process(
     capture_output: bool = False,
     print_command: bool = False,
 ) -> subprocess.CompletedProcess[str]:
-    if shutil.which(runner.command) is None:
+    if resolve_runner_command(runner.command) is None:
         raise SystemExit(
             f"Runner command `{runner.command}` was not found in PATH. "
             "Update config with a valid command or use --dry-run."
         )
+    import shlex
+    import subprocess
+
     cmd, kwargs = build_subprocess_command(runner, prompt)
     if capture_output:
         kwargs["capture_output"] = True
@@ -45,32 +64,46 @@ def run_runner_process(
     try:
         return subprocess.run(cmd, check=False, **kwargs)
     except OSError as exc:
+        if exc.errno == errno.E2BIG and runner.prompt_mode == "arg":
+            raise SystemExit(
+                "Prompt is too long to pass as a command-line argument. "
+                "Set the profile's prompt_mode to `stdin`."
+            ) from exc
         raise SystemExit(f"Failed to execute runner command: {exc}") from exc
 
 
+def _loads_object(payload: str) -> dict[str, Any] | None:
+    try:
+        parsed = loads(payload)
+    except JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
 def extract_json_object(text: str) -> dict[str, Any]:
-    payload = text.strip()
-    if not payload:
+    # Both decoders accept surrounding whitespace, so the output is scanned without a strip copy.
+    payload = text
+    if not payload or payload.isspace():
         raise SystemExit("Runner returned empty output; expected JSON object.")
-    match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", payload, re.DOTALL)
-    if match:
-        payload = match.group(1).strip()
-    try:
-        parsed = json.loads(payload)
-        if isinstance(parsed, dict):
-            return parsed
-    except json.JSONDecodeError:
-        pass
-    decoder = json.JSONDecoder()
-    for idx, ch in enumerate(payload):
-        if ch != "{":
-            continue
+    parsed = _loads_object(payload)
+    if parsed is not None:
+        return parsed
+    if "```" in payload:
+        match = FENCED_JSON_PATTERN.search(payload)
+        if match:
+            payload = match.group(1).strip()
+            parsed = _loads_object(payload)
+            if parsed is not None:
+                return parsed
+    idx = payload.find("{")
+    while idx != -1:
         try:
-            candidate, _ = decoder.raw_decode(payload[idx:])
+            candidate, _ = _RAW_DECODER.raw_decode(payload, idx)
         except json.JSONDecodeError:
-            continue
+            candidate = None
         if isinstance(candidate, dict):
             return candidate
+        idx = payload.find("{", idx + 1)
     raise SystemExit("Could not parse a JSON object from runner output.")
 
 
@@ -78,7 +111,7 @@ def maybe_resolve_existing_template_file(root: Path, name: str) -> Path | None:
     stem, explicit_ext = split_template_name(name)
     if explicit_ext:
         path = templates_dir(root) / f"{stem}{explicit_ext}"
-        return path if path.exists() else None
+        return path if os.path.exists(path) else None
     matches = find_template_files_by_stem(root, stem)
     if not matches:
         return None
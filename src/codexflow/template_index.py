@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from .app_constants import RACY_WINDOW_NS, TEMPLATE_EXT_TO_FORMAT
+
+_INDEX_CACHE: dict[Path, tuple[int, dict[str, list[Path]]]] = {}
+
+
+def _scan(tdir: Path) -> dict[str, list[Path]]:
+    index: dict[str, list[Path]] = {}
+    with os.scandir(tdir) as entries:
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if ext in TEMPLATE_EXT_TO_FORMAT and entry.is_file():
+                index.setdefault(stem, []).append(Path(entry.path))
+    for paths in index.values():
+        paths.sort(key=lambda p: p.suffix)
+    return index
+
+
+def template_index(tdir: Path) -> dict[str, list[Path]]:
+    """Map template stems to their files, sorted by suffix. Treat as read-only."""
+    try:
+        mtime_ns = os.stat(tdir).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    cached = _INDEX_CACHE.get(tdir)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    index = _scan(tdir)
+    if time.time_ns() - mtime_ns > RACY_WINDOW_NS:
+        _INDEX_CACHE[tdir] = (mtime_ns, index)
+    else:
+        _INDEX_CACHE.pop(tdir, None)
+    return index
+
+
+def forget_template_index(tdir: Path) -> None:
+    _INDEX_CACHE.pop(tdir, None)
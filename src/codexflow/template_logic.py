@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -9,7 +10,8 @@ from .app_constants import (
     DURATION_CHUNKS_PATTERN,
     REQUIRED_TEMPLATE_FIELDS,
 )
-from .mapping_yaml_dump import load_mapping_file, save_mapping_file
+from .mapping_yaml_dump import load_derived_mapping, remove_mapping_file, save_mapping_file
+from .template_index import forget_template_index
 from .template_paths import resolve_existing_template_file
 
 
@@ -20,6 +22,7 @@ def scope_text(template: dict[str, Any]) -> str:
     return "general"
 
 
+@lru_cache(maxsize=64)
 def parse_duration_seconds(raw: str, field_name: str) -> float:
     value = raw.strip().lower()
     if not value:
@@ -46,6 +49,9 @@ def cadence_text(template: dict[str, Any]) -> str:
     return f"repeat:{repeat_for}/{repeat_every}"
 
 
+_DURATION_FIELDS = ("repeat_for", "repeat_every")
+
+
 def normalize_template_data(data: dict[str, Any], fallback_name: str | None = None) -> dict[str, Any]:
     out: dict[str, Any] = {}
     for field in REQUIRED_TEMPLATE_FIELDS:
@@ -59,35 +65,54 @@ def normalize_template_data(data: dict[str, Any], fallback_name: str | None = No
             raise SystemExit(f"Template field `{field}` cannot be empty")
         out[field] = value
     profile = data.get("profile")
-    if profile is not None and str(profile).strip():
-        out["profile"] = str(profile).strip()
+    if profile is not None:
+        profile = str(profile).strip()
+        if profile:
+            out["profile"] = profile
     scope = str(data.get("scope", "general")).strip().lower() or "general"
     if scope not in ALLOWED_SCOPES:
         raise SystemExit("Template scope must be `general` or `specific`")
     out["scope"] = scope
-    specific_to = str(data.get("specific_to", "")).strip() or None
-    if scope == "specific" and not specific_to:
-        raise SystemExit("Template scope is `specific` but `specific_to` is missing")
-    if scope == "specific" and specific_to:
+    if scope == "specific":
+        specific_to = str(data.get("specific_to", "")).strip()
+        if not specific_to:
+            raise SystemExit("Template scope is `specific` but `specific_to` is missing")
         out["specific_to"] = specific_to
-    repeat_for = str(data.get("repeat_for", "")).strip() or None
-    if repeat_for:
-        parse_duration_seconds(repeat_for, "repeat_for")
-        out["repeat_for"] = repeat_for
-    repeat_every = str(data.get("repeat_every", "")).strip() or None
-    if repeat_every:
-        parse_duration_seconds(repeat_every, "repeat_every")
-        out["repeat_every"] = repeat_every
-    if repeat_every and not repeat_for:
+    for field in _DURATION_FIELDS:
+        value = str(data.get(field, "")).strip()
+        if value:
+            parse_duration_seconds(value, field)
+            out[field] = value
+    if "repeat_every" in out and "repeat_for" not in out:
         raise SystemExit("Template has `repeat_every` but `repeat_for` is missing")
     return out
 
 
+def _normalize_loaded(path: Path, raw: dict[str, Any]) -> dict[str, Any]:
+    return normalize_template_data(raw, fallback_name=path.stem)
+
+
+def load_template_normalized(path: Path) -> dict[str, Any]:
+    # Normalized once per file version and cached by path, mtime and size.
+    return load_derived_mapping(path, _normalize_loaded)
+
+
 def load_template(root: Path, name: str) -> tuple[Path, dict[str, Any]]:
     path = resolve_existing_template_file(root, name)
-    normalized = normalize_template_data(load_mapping_file(path), fallback_name=path.stem)
-    return path, normalized
+    return path, load_template_normalized(path)
 
 
 def save_template(path: Path, data: dict[str, Any]) -> None:
+    forget_template_index(path.parent)
     save_mapping_file(path, normalize_template_data(data))
+
+
+def save_template_prevalidated(path: Path, data: dict[str, Any]) -> None:
+    # For data that came out of load_template with only already-valid fields replaced.
+    forget_template_index(path.parent)
+    save_mapping_file(path, data)
+
+
+def remove_template(path: Path) -> None:
+    forget_template_index(path.parent)
+    remove_mapping_file(path)
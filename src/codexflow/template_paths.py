@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from .app_constants import (
@@ -8,47 +9,44 @@ from .app_constants import (
     TEMPLATE_EXT_TO_FORMAT,
 )
 from .app_paths import templates_dir
+from .template_index import template_index
 
 
 def validate_template_name_input(name: str) -> None:
     if not name.strip():
         raise SystemExit("Template name cannot be empty")
-    if Path(name).name != name:
+    if "/" in name or "\\" in name or name in {".", ".."}:
         raise SystemExit("Template name cannot contain path separators")
 
 
 def split_template_name(name: str) -> tuple[str, str | None]:
     validate_template_name_input(name)
-    suffix = Path(name).suffix.lower()
-    if suffix in TEMPLATE_EXT_TO_FORMAT:
-        stem = Path(name).stem
-        if not stem:
-            raise SystemExit("Template name cannot be empty")
-        return stem, suffix
+    dot = name.rfind(".")
+    if dot > 0:
+        suffix = name[dot:].lower()
+        if suffix in TEMPLATE_EXT_TO_FORMAT:
+            return name[:dot], suffix
     return name, None
 
 
 def list_template_files(root: Path) -> list[Path]:
-    files: list[Path] = []
-    for ext in TEMPLATE_EXT_TO_FORMAT:
-        files.extend(templates_dir(root).glob(f"*{ext}"))
-    return sorted(files, key=lambda p: (p.stem, p.suffix))
+    index = template_index(templates_dir(root))
+    return [path for stem in sorted(index) for path in index[stem]]
+
+
+def template_stems(root: Path) -> set[str]:
+    return set(template_index(templates_dir(root)))
 
 
 def find_template_files_by_stem(root: Path, stem: str) -> list[Path]:
-    out: list[Path] = []
-    for ext in TEMPLATE_EXT_TO_FORMAT:
-        candidate = templates_dir(root) / f"{stem}{ext}"
-        if candidate.exists():
-            out.append(candidate)
-    return sorted(out, key=lambda p: p.suffix)
+    return list(template_index(templates_dir(root)).get(stem, ()))
 
 
 def resolve_existing_template_file(root: Path, name: str) -> Path:
     stem, explicit_ext = split_template_name(name)
     if explicit_ext:
         path = templates_dir(root) / f"{stem}{explicit_ext}"
-        if not path.exists():
+        if not os.path.exists(path):
             raise SystemExit(f"Template `{name}` not found at {path}")
         return path
     matches = find_template_files_by_stem(root, stem)
@@ -65,7 +63,7 @@ def resolve_new_template_file(
     name: str,
     template_format: str | None,
     preserve_extension: str | None = None,
-) -> Path:
+) -> tuple[Path, str]:
     stem, explicit_ext = split_template_name(name)
     if explicit_ext:
         explicit_format = TEMPLATE_EXT_TO_FORMAT[explicit_ext]
@@ -73,11 +71,11 @@ def resolve_new_template_file(
             raise SystemExit(
                 f"Conflicting format for `{name}`. Extension implies {explicit_format}."
             )
-        return templates_dir(root) / f"{stem}{explicit_ext}"
+        return templates_dir(root) / f"{stem}{explicit_ext}", stem
     if template_format:
         ext = FORMAT_TO_TEMPLATE_EXT[template_format]
     elif preserve_extension:
         ext = preserve_extension
     else:
         ext = FORMAT_TO_TEMPLATE_EXT[DEFAULT_TEMPLATE_FORMAT]
-    return templates_dir(root) / f"{stem}{ext}"
+    return templates_dir(root) / f"{stem}{ext}", stem
@@ -1,22 +1,125 @@
 from __future__ import annotations
 
+import atexit
+import io
+import json
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
+import unittest
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from codexflow.cli import main
 
 ROOT = Path(__file__).resolve().parents[1]
 
+# Built once: environment for CLI child processes, with the source tree importable.
+_CLI_ENV = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+
+# Small-file workloads run faster on tmpfs; CODEXFLOW_TEST_TMP overrides the location.
+_TMP_ROOT = os.environ.get("CODEXFLOW_TEST_TMP") or (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+)
+
+_PRISTINE_PROJECT: Path | None = None
+
+
+@contextmanager
+def _working_directory(path: Path) -> Iterator[None]:
+    # contextlib.chdir only exists on Python 3.11+.
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def make_tmpdir() -> tempfile.TemporaryDirectory[str]:
+    return tempfile.TemporaryDirectory(dir=_TMP_ROOT)
+
+
+def _exit_code(exc: SystemExit, stderr: io.StringIO) -> int:
+    # Mirrors the interpreter: None is success, other non-int codes are printed and exit 1.
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=stderr)
+    return 1
+
 
 def run_cli(cwd: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    # CODEXFLOW_TEST_SUBPROCESS=1 routes every call through a real interpreter.
+    if os.environ.get("CODEXFLOW_TEST_SUBPROCESS") == "1":
+        return run_cli_process(cwd, *args)
+    return run_cli_in_process(cwd, *args)
+
+
+def run_cli_in_process(cwd: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    # Runs main() in this process; runner children still inherit the real stdout/stderr.
+    argv = list(args)
+    out, err = io.StringIO(), io.StringIO()
+    with _working_directory(cwd), redirect_stdout(out), redirect_stderr(err):
+        try:
+            returncode = main(argv)
+        except SystemExit as exc:
+            returncode = _exit_code(exc, err)
+    return subprocess.CompletedProcess(argv, returncode, out.getvalue(), err.getvalue())
+
+
+def run_cli_batch(cwd: Path, *commands: list[str]) -> subprocess.CompletedProcess[str]:
+    # Runs commands in order and stops at the first failure, whose result is returned as is.
+    stdout: list[str] = []
+    stderr: list[str] = []
+    for argv in commands:
+        proc = run_cli(cwd, *argv)
+        if proc.returncode != 0:
+            return proc
+        stdout.append(proc.stdout)
+        stderr.append(proc.stderr)
+    return subprocess.CompletedProcess(list(commands), 0, "".join(stdout), "".join(stderr))
+
+
+def cli_json(cwd: Path, *args: str) -> Any:
+    # Runs a JSON-printing command (e.g. `show`) and parses its output once.
+    proc = run_cli(cwd, *args)
+    if proc.returncode != 0:
+        raise AssertionError(f"codexflow {' '.join(args)} failed: {proc.stderr}")
+    return json.loads(proc.stdout)
+
+
+def assert_all_in(test: unittest.TestCase, haystack: str, needles: Iterable[str]) -> None:
+    # One assertion that reports every missing needle, not just the first.
+    missing = [needle for needle in needles if needle not in haystack]
+    if missing:
+        test.fail(f"Missing {missing!r} in output:\n{haystack}")
+
+
+def run_cli_process(cwd: Path, *args: str) -> subprocess.CompletedProcess[str]:
     cmd = [sys.executable, "-m", "codexflow.cli", *args]
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(ROOT / "src")
     return subprocess.run(
         cmd,
         cwd=cwd,
-        env=env,
+        env=_CLI_ENV,
         text=True,
         capture_output=True,
         check=False,
     )
+
+
+def init_project(cwd: Path) -> None:
+    # `codexflow init` runs once per test process; later projects copy its output.
+    global _PRISTINE_PROJECT
+    if _PRISTINE_PROJECT is None:
+        pristine = Path(tempfile.mkdtemp(prefix="codexflow-init-", dir=_TMP_ROOT))
+        atexit.register(shutil.rmtree, pristine, ignore_errors=True)
+        proc = run_cli(pristine, "init")
+        if proc.returncode != 0:
+            raise RuntimeError(f"codexflow init failed: {proc.stderr}")
+        _PRISTINE_PROJECT = pristine
+    shutil.copytree(_PRISTINE_PROJECT, cwd, dirs_exist_ok=True)
@@ -2,18 +2,18 @@ from __future__ import annotations
 
 import json
 import sys
-import tempfile
 import unittest
 from pathlib import Path
 
-from support import run_cli
+from codexflow.ai_utils import build_ai_template_prompt
+from support import cli_json, init_project, make_tmpdir, run_cli
 
 
 class AiCliTests(unittest.TestCase):
     def test_ai_create_and_update(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
+        with make_tmpdir() as tmp:
             cwd = Path(tmp)
-            self.assertEqual(run_cli(cwd, "init").returncode, 0)
+            init_project(cwd)
 
             script = (
                 "import json,sys;_ = sys.stdin.read();"
@@ -53,7 +53,7 @@ class AiCliTests(unittest.TestCase):
                 "yaml",
             )
             self.assertEqual(created.returncode, 0, created.stderr)
-            created_data = json.loads(run_cli(cwd, "show", "ai-role").stdout)
+            created_data = cli_json(cwd, "show", "ai-role")
             self.assertEqual(created_data["format"], "yaml")
             self.assertEqual(created_data["scope"], "specific")
             self.assertEqual(created_data["specific_to"], "checkout-service")
@@ -72,15 +72,15 @@ class AiCliTests(unittest.TestCase):
                 "json",
             )
             self.assertEqual(updated.returncode, 0, updated.stderr)
-            updated_data = json.loads(run_cli(cwd, "show", "ai-role").stdout)
+            updated_data = cli_json(cwd, "show", "ai-role")
             self.assertEqual(updated_data["format"], "json")
             self.assertEqual(updated_data["scope"], "general")
             self.assertNotIn("specific_to", updated_data)
 
     def test_ai_auto_name_from_request(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
+        with make_tmpdir() as tmp:
             cwd = Path(tmp)
-            self.assertEqual(run_cli(cwd, "init").returncode, 0)
+            init_project(cwd)
 
             script = (
                 "import json,sys;_ = sys.stdin.read();"
@@ -123,9 +123,9 @@ class AiCliTests(unittest.TestCase):
             )
 
     def test_ai_tolerates_null_like_optional_values(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
+        with make_tmpdir() as tmp:
             cwd = Path(tmp)
-            self.assertEqual(run_cli(cwd, "init").returncode, 0)
+            init_project(cwd)
 
             script = (
                 "import json,sys;_ = sys.stdin.read();"
@@ -157,13 +157,29 @@ class AiCliTests(unittest.TestCase):
 
             created = run_cli(cwd, "ai", "Create a reusable role", "--name", "nullish-role", "--runner-profile", "mock-ai")
             self.assertEqual(created.returncode, 0, created.stderr)
-            payload = json.loads(run_cli(cwd, "show", "nullish-role").stdout)
+            payload = cli_json(cwd, "show", "nullish-role")
             self.assertEqual(payload["scope"], "general")
             self.assertNotIn("profile", payload)
             self.assertNotIn("specific_to", payload)
             self.assertNotIn("repeat_for", payload)
             self.assertNotIn("repeat_every", payload)
 
+    def test_prompt_context_matches_stdlib_json(self) -> None:
+        existing = {"name": "café", "description": "naïve ☃", "limit": float("nan")}
+        prompt = build_ai_template_prompt("update", "café", "Fix ü", existing, None, None, None, "2h", None)
+        context = {
+            "mode": "update",
+            "template_name": "café",
+            "request": "Fix ü",
+            "existing_template": existing,
+            "scope_override": None,
+            "specific_to_override": None,
+            "bind_profile_override": None,
+            "repeat_for_override": "2h",
+            "repeat_every_override": None,
+        }
+        self.assertTrue(prompt.endswith("Context:\n" + json.dumps(context, indent=2) + "\n"))
+
 
 if __name__ == "__main__":
     unittest.main()
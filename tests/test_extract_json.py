@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import unittest
+
+from codexflow.runner_utils import extract_json_object
+
+
+class ExtractJsonObjectTests(unittest.TestCase):
+    def test_plain_object(self) -> None:
+        self.assertEqual(extract_json_object('  {"a": "```"}\n'), {"a": "```"})
+
+    def test_fenced_object(self) -> None:
+        text = 'Here you go:\n```json\n{"a": 1}\n```\nDone.'
+        self.assertEqual(extract_json_object(text), {"a": 1})
+
+    def test_object_after_preamble_and_braces(self) -> None:
+        text = 'Thinking {not json} then {"b": [1, {"c": 2}]} trailing'
+        self.assertEqual(extract_json_object(text), {"b": [1, {"c": 2}]})
+
+    def test_no_object(self) -> None:
+        with self.assertRaises(SystemExit):
+            extract_json_object("[1, 2] and {broken")
+        with self.assertRaises(SystemExit):
+            extract_json_object("   ")
+
+
+if __name__ == "__main__":
+    unittest.main()
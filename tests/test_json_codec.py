@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from codexflow import json_codec
+from codexflow.mapping_io import load_json, save_json
+from support import make_tmpdir
+
+SAMPLES = (
+    {"a": "café ☃", "b": 1, "c": None},
+    {"nan": float("nan"), "inf": float("inf"), "neg": float("-inf"), "big": 1e16},
+    {"x": [1, "ü", float("nan")], "y": {"z": True, "w": "naïve"}},
+    {"big": 123456789012345678901234567890},
+    {},
+)
+
+
+class JsonCodecTests(unittest.TestCase):
+    def test_dumps_match_stdlib_byte_for_byte(self) -> None:
+        for data in SAMPLES:
+            with self.subTest(data=data):
+                self.assertEqual(json_codec.dumps_indented(data), json.dumps(data, indent=2))
+
+    def test_print_json_matches_stdlib(self) -> None:
+        for data in SAMPLES:
+            with self.subTest(data=data):
+                out = io.StringIO()
+                with redirect_stdout(out):
+                    json_codec.print_json(data)
+                self.assertEqual(out.getvalue(), json.dumps(data, indent=2) + "\n")
+
+    def test_saved_file_is_ascii_and_keeps_nan(self) -> None:
+        with make_tmpdir() as tmp:
+            path = Path(tmp) / "config.json"
+            save_json(path, {"s": "café", "n": float("nan")})
+            self.assertEqual(path.read_bytes(), b'{\n  "s": "caf\\u00e9",\n  "n": NaN\n}\n')
+
+    def test_lone_surrogate_round_trips_through_save(self) -> None:
+        with make_tmpdir() as tmp:
+            path = Path(tmp) / "config.json"
+            path.write_text('{"s": "\\ud800"}', encoding="ascii")
+            data = load_json(path)
+            save_json(path, data)
+            self.assertEqual(path.read_text(encoding="ascii"), '{\n  "s": "\\ud800"\n}\n')
+
+    def test_loads_keeps_big_ints_and_nan(self) -> None:
+        payload = b'{"big": 123456789012345678901234567890, "nan": NaN, "x": 1.5}'
+        for data in (json_codec.loads(payload), json_codec.loads(payload.decode("utf-8"))):
+            self.assertEqual(data["big"], 123456789012345678901234567890)
+            self.assertIsInstance(data["big"], int)
+            self.assertNotEqual(data["nan"], data["nan"])
+            self.assertEqual(data["x"], 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import os
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from codexflow import mapping_yaml_dump
+from codexflow.mapping_io import load_json, save_json
+from codexflow.mapping_yaml_dump import load_mapping_file, remove_mapping_file, save_mapping_file
+from codexflow.template_logic import load_template_normalized
+from support import make_tmpdir
+
+
+class MappingCacheTests(unittest.TestCase):
+    def test_reload_after_external_and_internal_writes(self) -> None:
+        with make_tmpdir() as tmp:
+            path = Path(tmp) / "config.json"
+            path.write_text(json.dumps({"a": 1}), encoding="utf-8")
+            first = load_json(path)
+            first["a"] = 99
+            self.assertEqual(load_json(path), {"a": 1})
+
+            path.write_text(json.dumps({"a": 1, "b": 2}), encoding="utf-8")
+            self.assertEqual(load_json(path), {"a": 1, "b": 2})
+
+            save_json(path, {"c": 3})
+            self.assertEqual(load_json(path), {"c": 3})
+
+    def test_nested_edits_do_not_leak_into_the_cache(self) -> None:
+        with make_tmpdir() as tmp:
+            path = Path(tmp) / "config.json"
+            save_json(path, {"profiles": {"a": {"command": "codex"}}})
+            cfg = load_json(path)
+            cfg["profiles"]["a"]["command"] = "MUTATED"
+            del load_json(path)["profiles"]["a"]
+            self.assertEqual(load_json(path), {"profiles": {"a": {"command": "codex"}}})
+
+    def test_non_object_json_is_rejected(self) -> None:
+        with make_tmpdir() as tmp:
+            path = Path(tmp) / "config.json"
+            path.write_text("[1, 2]", encoding="utf-8")
+            with self.assertRaises(SystemExit):
+                load_json(path)
+
+    def test_removed_file_is_not_served_from_cache(self) -> None:
+        with make_tmpdir() as tmp:
+            path = Path(tmp) / "role.json"
+            path.write_text(json.dumps({"name": "role"}), encoding="utf-8")
+            self.assertEqual(load_mapping_file(path), {"name": "role"})
+            remove_mapping_file(path)
+            with self.assertRaises(FileNotFoundError):
+                load_mapping_file(path)
+
+    def test_identical_save_skips_the_write(self) -> None:
+        with make_tmpdir() as tmp:
+            path = Path(tmp) / "role.json"
+            data = {"name": "role", "scope": "general"}
+            self.assertTrue(save_mapping_file(path, data))
+            self.assertEqual(path.read_text(encoding="utf-8"), json.dumps(data, indent=2) + "\n")
+            self.assertFalse(save_mapping_file(path, dict(data)))
+            self.assertTrue(save_mapping_file(path, {**data, "scope": "specific"}))
+            self.assertEqual(load_mapping_file(path)["scope"], "specific")
+
+    def test_normalized_template_tracks_file_changes(self) -> None:
+        with make_tmpdir() as tmp:
+            path = Path(tmp) / "role.json"
+            base = {"description": "d", "role_prompt": "r", "instructions": "i"}
+            path.write_text(json.dumps({**base, "scope": " General "}), encoding="utf-8")
+            first = load_template_normalized(path)
+            self.assertEqual(first["name"], "role")
+            self.assertEqual(first["scope"], "general")
+            first["scope"] = "mutated"
+            self.assertEqual(load_template_normalized(path)["scope"], "general")
+
+            path.write_text(json.dumps({**base, "name": "renamed"}), encoding="utf-8")
+            self.assertEqual(load_template_normalized(path)["name"], "renamed")
+
+    def test_only_settled_files_are_served_from_cache(self) -> None:
+        with make_tmpdir() as tmp:
+            path = Path(tmp) / "role.json"
+            base = {"description": "d", "role_prompt": "r", "instructions": "i"}
+            path.write_text(json.dumps({**base, "name": "aaaa"}), encoding="utf-8")
+            mtime_ns = path.stat().st_mtime_ns
+            self.assertEqual(load_template_normalized(path)["name"], "aaaa")
+            # Same size and mtime, but written within the racy window: must be re-read.
+            path.write_text(json.dumps({**base, "name": "bbbb"}), encoding="utf-8")
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+            self.assertEqual(load_template_normalized(path)["name"], "bbbb")
+
+            settled = mtime_ns - 10_000_000_000
+            os.utime(path, ns=(settled, settled))
+            parse = mock.Mock(wraps=mapping_yaml_dump._parse_mapping_file)
+            with mock.patch.object(mapping_yaml_dump, "_parse_mapping_file", parse):
+                self.assertEqual(load_template_normalized(path)["name"], "bbbb")
+                self.assertEqual(load_template_normalized(path)["name"], "bbbb")
+            self.assertEqual(parse.call_count, 1)
+
+    def test_save_through_symlink_updates_the_target(self) -> None:
+        with make_tmpdir() as tmp:
+            target = Path(tmp) / "real.json"
+            link = Path(tmp) / "link.json"
+            save_json(target, {"a": 1})
+            try:
+                link.symlink_to(target)
+            except (OSError, NotImplementedError):
+                self.skipTest("symlinks are not available")
+            save_json(link, {"a": 2})
+            self.assertTrue(link.is_symlink())
+            self.assertEqual(load_json(target), {"a": 2})
+            self.assertEqual(load_json(link), {"a": 2})
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()), ["link.json", "real.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import io
+import unittest
+from contextlib import redirect_stderr
+
+from codexflow.parser import build_parser, requested_command
+
+ARGVS = [
+    ["list"],
+    ["--root", "/tmp/x", "show", "planner"],
+    ["--root=/tmp/x", "rename", "a", "b", "--format", "yaml"],
+    ["run", "planner", "ship it", "--var", "a=1", "--var", "b=2", "--max-runs", "3"],
+    ["ai", "build", "a", "reviewer", "--dry-run"],
+    ["profile", "add", "fast", "--command", "echo", "--arg=-n"],
+    ["edit", "planner", "--clear-repeat"],
+]
+
+
+class ParserTests(unittest.TestCase):
+    def test_requested_command(self) -> None:
+        self.assertEqual(requested_command(["--root", "x", "list"]), "list")
+        self.assertEqual(requested_command(["--root=x", "ai", "hi"]), "ai")
+        self.assertIsNone(requested_command(["-h"]))
+        self.assertIsNone(requested_command(["--ro", "x", "list"]))
+        self.assertIsNone(requested_command([]))
+
+    def test_single_subcommand_parser_matches_full_parser(self) -> None:
+        for argv in ARGVS:
+            with self.subTest(argv=argv):
+                full = build_parser().parse_args(argv)
+                lazy = build_parser(argv).parse_args(argv)
+                self.assertEqual(vars(lazy), vars(full))
+
+    def test_parser_is_reused_across_calls(self) -> None:
+        parser = build_parser(["run", "planner", "a"])
+        self.assertIs(build_parser(["run", "other", "b", "--var", "x=1"]), parser)
+        first = parser.parse_args(["run", "planner", "a", "--var", "x=1"])
+        second = parser.parse_args(["run", "planner", "a"])
+        self.assertEqual(first.var, ["x=1"])
+        self.assertEqual(second.var, [])
+
+    def test_single_subcommand_parser_errors_match_full_parser(self) -> None:
+        def error(parser, argv: list[str]) -> str:
+            err = io.StringIO()
+            with redirect_stderr(err), self.assertRaises(SystemExit):
+                parser.parse_args(argv)
+            return err.getvalue()
+
+        for argv in (["show", "a", "b"], ["--root", "x", "run"], ["profile", "bogus"]):
+            with self.subTest(argv=argv):
+                lazy = error(build_parser(argv), argv)
+                self.assertEqual(lazy, error(build_parser(), argv))
+        self.assertIn(
+            "{init,list,show,create,edit,rename,copy,delete,ai,run,profile}",
+            build_parser(["show"]).format_usage(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,64 +1,96 @@
 from __future__ import annotations
 
 import sys
-import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from support import run_cli
+from support import init_project, make_tmpdir, run_cli, run_cli_in_process, run_cli_process
+
+COUNTER_SCRIPT = (
+    "import sys;_ = sys.stdin.read();"
+    "f=open('runs.log','a',encoding='utf-8',newline='');"
+    "f.write('run\\n');f.close()"
+)
+
+
+class _FakeClock:
+    # Stands in for the `time` module in codexflow.cmds.run; sleeping advances the clock instantly.
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
 
 
 class RepeatCliTests(unittest.TestCase):
-    def test_template_default_repeat_runtime(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            cwd = Path(tmp)
-            self.assertEqual(run_cli(cwd, "init").returncode, 0)
+    def _create_counter_template(self, cwd: Path, repeat_for: str, repeat_every: str) -> None:
+        init_project(cwd)
+        add_profile = run_cli(
+            cwd,
+            "profile",
+            "add",
+            "counter",
+            "--command",
+            sys.executable,
+            "--arg=-c",
+            "--arg",
+            COUNTER_SCRIPT,
+            "--prompt-mode",
+            "stdin",
+        )
+        self.assertEqual(add_profile.returncode, 0, add_profile.stderr)
+
+        create = run_cli(
+            cwd,
+            "create",
+            "repeat-role",
+            "--description",
+            "Repeat role",
+            "--role",
+            "Run task",
+            "--instructions",
+            "Execute task",
+            "--profile",
+            "counter",
+            "--repeat-for",
+            repeat_for,
+            "--repeat-every",
+            repeat_every,
+        )
+        self.assertEqual(create.returncode, 0, create.stderr)
 
-            counter_script = (
-                "import sys;_ = sys.stdin.read();"
-                "f=open('runs.log','a',encoding='utf-8');"
-                "f.write('run\\n');f.close()"
-            )
-            add_profile = run_cli(
-                cwd,
-                "profile",
-                "add",
-                "counter",
-                "--command",
-                sys.executable,
-                "--arg=-c",
-                "--arg",
-                counter_script,
-                "--prompt-mode",
-                "stdin",
-            )
-            self.assertEqual(add_profile.returncode, 0, add_profile.stderr)
+    def _run_count(self, cwd: Path) -> int:
+        runs_file = cwd / "runs.log"
+        self.assertTrue(runs_file.exists())
+        # The counter appends exactly one "run\n" per invocation.
+        return runs_file.read_bytes().count(b"run\n")
 
-            create = run_cli(
-                cwd,
-                "create",
-                "repeat-role",
-                "--description",
-                "Repeat role",
-                "--role",
-                "Run task",
-                "--instructions",
-                "Execute task",
-                "--profile",
-                "counter",
-                "--repeat-for",
-                "3s",
-                "--repeat-every",
-                "1s",
-            )
-            self.assertEqual(create.returncode, 0, create.stderr)
+    def test_template_default_repeat_runtime(self) -> None:
+        with make_tmpdir() as tmp:
+            cwd = Path(tmp)
+            self._create_counter_template(cwd, "3s", "1s")
+            clock = _FakeClock()
+            with mock.patch("codexflow.cmds.run.time", clock):
+                run = run_cli_in_process(cwd, "run", "repeat-role", "Execute workflow")
+            self.assertEqual(run.returncode, 0, run.stderr)
+            # Runs at t=0, 1, 2 and 3; the window is exhausted after the fourth.
+            self.assertEqual(self._run_count(cwd), 4)
+            self.assertEqual(clock.sleeps, [1.0, 1.0, 1.0])
 
-            run = run_cli(cwd, "run", "repeat-role", "Execute workflow")
+    def test_repeat_runtime_end_to_end(self) -> None:
+        with make_tmpdir() as tmp:
+            cwd = Path(tmp)
+            self._create_counter_template(cwd, "5s", "1s")
+            # Real interpreter and clock: exit code, sleeping and runner children.
+            run = run_cli_process(cwd, "run", "repeat-role", "Execute workflow", "--max-runs", "2")
             self.assertEqual(run.returncode, 0, run.stderr)
-            runs_file = cwd / "runs.log"
-            self.assertTrue(runs_file.exists())
-            lines = [line for line in runs_file.read_text(encoding="utf-8").splitlines() if line]
-            self.assertGreaterEqual(len(lines), 2)
+            self.assertEqual(self._run_count(cwd), 2)
 
 
 if __name__ == "__main__":
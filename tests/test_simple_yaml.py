@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import unittest
+
+from codexflow.mapping_io import parse_simple_yaml
+from codexflow.mapping_yaml_dump import dump_simple_yaml
+
+
+class SimpleYamlTests(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        data = {
+            "name": "triage",
+            "role_prompt": "Line one\n\n  indented line\nlast",
+            "scope": "specific",
+            "profile": None,
+            "enabled": True,
+            "args": ["a", "b"],
+        }
+        self.assertEqual(parse_simple_yaml(dump_simple_yaml(data)), data)
+
+    def test_comments_quotes_and_blocks(self) -> None:
+        text = "# header\nname: 'it''s'\nbody: |\n  first\n\n  second\n\nnext: ~\n"
+        self.assertEqual(
+            parse_simple_yaml(text),
+            {"name": "it's", "body": "first\n\nsecond", "next": None},
+        )
+
+    def test_rejects_nested_and_invalid_lines(self) -> None:
+        for text in (" indented: 1\n", "no colon here\n", ": value\n"):
+            with self.assertRaises(SystemExit):
+                parse_simple_yaml(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
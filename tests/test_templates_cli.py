@@ -1,32 +1,35 @@
 from __future__ import annotations
 
-import json
-import tempfile
+import os
+import shutil
+import time
 import unittest
 from pathlib import Path
 
-from support import run_cli
+from codexflow.mapping_yaml_dump import load_mapping_file
+from codexflow.template_logic import normalize_template_data
+from support import assert_all_in, cli_json, init_project, make_tmpdir, run_cli, run_cli_batch
 
 
 class TemplateCliTests(unittest.TestCase):
     def test_init_and_list(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
+        with make_tmpdir() as tmp:
             cwd = Path(tmp)
             self.assertEqual(run_cli(cwd, "init").returncode, 0)
-            default_profile = json.loads(run_cli(cwd, "profile", "show", "default").stdout)
+            default_profile = cli_json(cwd, "profile", "show", "default")
             self.assertEqual(default_profile["command"], "codex")
             self.assertIn("exec", default_profile["args"])
             proc_list = run_cli(cwd, "list")
             self.assertEqual(proc_list.returncode, 0, proc_list.stderr)
-            self.assertIn("planning.json", proc_list.stdout)
-            self.assertIn("testing.json", proc_list.stdout)
-            self.assertIn("review.json", proc_list.stdout)
-            self.assertIn("general", proc_list.stdout)
+            assert_all_in(self, proc_list.stdout, ["planning.json", "testing.json", "review.json", "general"])
+            for name in ("planning", "testing", "review"):
+                stored = load_mapping_file(cwd / ".codexflow" / "templates" / f"{name}.json")
+                self.assertEqual(list(normalize_template_data(stored).items()), list(stored.items()))
 
     def test_yaml_scope_and_variables(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
+        with make_tmpdir() as tmp:
             cwd = Path(tmp)
-            self.assertEqual(run_cli(cwd, "init").returncode, 0)
+            init_project(cwd)
             create = run_cli(
                 cwd,
                 "create",
@@ -47,8 +50,7 @@ class TemplateCliTests(unittest.TestCase):
             self.assertEqual(create.returncode, 0, create.stderr)
 
             listed = run_cli(cwd, "list")
-            self.assertIn("triage.yaml", listed.stdout)
-            self.assertIn("specific:checkout-service", listed.stdout)
+            assert_all_in(self, listed.stdout, ["triage.yaml", "specific:checkout-service"])
 
             dry = run_cli(
                 cwd,
@@ -60,48 +62,80 @@ class TemplateCliTests(unittest.TestCase):
                 "--dry-run",
             )
             self.assertEqual(dry.returncode, 0, dry.stderr)
-            self.assertIn("qa-team", dry.stdout)
-            self.assertIn("checkout-service", dry.stdout)
+            assert_all_in(self, dry.stdout, ["qa-team", "checkout-service"])
 
     def test_edit_and_rename(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
+        with make_tmpdir() as tmp:
             cwd = Path(tmp)
-            self.assertEqual(run_cli(cwd, "init").returncode, 0)
-            create = run_cli(
+            init_project(cwd)
+            steps = run_cli_batch(
                 cwd,
-                "create",
-                "planner",
-                "--description",
-                "Planner role",
-                "--role",
-                "You plan work.",
-                "--instructions",
-                "Return a concise plan.",
+                [
+                    "create",
+                    "planner",
+                    "--description",
+                    "Planner role",
+                    "--role",
+                    "You plan work.",
+                    "--instructions",
+                    "Return a concise plan.",
+                ],
+                [
+                    "edit",
+                    "planner",
+                    "--description",
+                    "Updated planner",
+                    "--scope",
+                    "specific",
+                    "--specific-to",
+                    "migration-project",
+                ],
+                ["rename", "planner", "planner-v2", "--format", "yaml"],
             )
-            self.assertEqual(create.returncode, 0, create.stderr)
+            self.assertEqual(steps.returncode, 0, steps.stderr)
 
-            edit = run_cli(
-                cwd,
-                "edit",
-                "planner",
-                "--description",
-                "Updated planner",
-                "--scope",
-                "specific",
-                "--specific-to",
-                "migration-project",
+            payload = cli_json(cwd, "show", "planner-v2")
+            expected = {
+                "name": "planner-v2",
+                "format": "yaml",
+                "scope": "specific",
+                "specific_to": "migration-project",
+            }
+            self.assertEqual({key: payload.get(key) for key in expected}, expected)
+
+    def test_profile_remove_sees_escaped_profile_keys(self) -> None:
+        with make_tmpdir() as tmp:
+            cwd = Path(tmp)
+            init_project(cwd)
+            added = run_cli(cwd, "profile", "add", "fast", "--command", "echo")
+            self.assertEqual(added.returncode, 0, added.stderr)
+            template = cwd / ".codexflow" / "templates" / "escaped.json"
+            template.write_text(
+                '{"description": "d", "role_prompt": "r", "instructions": "i", "\\u0070rofile": "fast"}',
+                encoding="utf-8",
             )
-            self.assertEqual(edit.returncode, 0, edit.stderr)
+            removed = run_cli(cwd, "profile", "remove", "fast")
+            self.assertNotEqual(removed.returncode, 0)
+            assert_all_in(self, removed.stderr, ["used by template `escaped`"])
+            self.assertEqual(cli_json(cwd, "profile", "show", "fast")["command"], "echo")
+
+    def test_deleted_project_reports_missing_init(self) -> None:
+        with make_tmpdir() as tmp:
+            cwd = Path(tmp)
+            init_project(cwd)
+            config_dir = cwd / ".codexflow"
+            settled = time.time_ns() - 10_000_000_000
+            os.utime(config_dir, ns=(settled, settled))
+            self.assertEqual(run_cli(cwd, "list").returncode, 0)
 
-            renamed = run_cli(cwd, "rename", "planner", "planner-v2", "--format", "yaml")
-            self.assertEqual(renamed.returncode, 0, renamed.stderr)
+            (config_dir / "config.json").unlink()
+            missing_config = run_cli(cwd, "list")
+            assert_all_in(self, missing_config.stderr, ["codexflow init", "config.json"])
 
-            show = run_cli(cwd, "show", "planner-v2")
-            payload = json.loads(show.stdout)
-            self.assertEqual(payload["name"], "planner-v2")
-            self.assertEqual(payload["format"], "yaml")
-            self.assertEqual(payload["scope"], "specific")
-            self.assertEqual(payload["specific_to"], "migration-project")
+            shutil.rmtree(config_dir)
+            missing_dir = run_cli(cwd, "list")
+            self.assertNotEqual(missing_dir.returncode, 0)
+            assert_all_in(self, missing_dir.stderr, ["codexflow init"])
 
 
 if __name__ == "__main__":